@@ -0,0 +1,141 @@
+"""Intent classification model search: cross-validated comparison of linear models."""
+import pickle
+import shutil
+import tempfile
+import time
+
+import numpy as np
+from joblib import dump
+from rich.table import Table
+from sklearn.base import clone
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.svm import SVC, LinearSVC
+
+from classification.LinearSVC import get_data
+from utils import console
+
+# vectorizer settings -- word unigrams/bigrams, or character n-grams (robust to typos)
+VECTORIZERS = [
+    {"vect__analyzer": ["word"], "vect__ngram_range": [(1, 1), (1, 2)]},
+    {"vect__analyzer": ["char_wb"], "vect__ngram_range": [(2, 4)]},
+]
+
+# model families and their hyperparameters; all must support `predict_proba`, so SVMs
+# are calibrated (as a single model, to keep inference fast)
+MODELS = [
+    {
+        "clf": [CalibratedClassifierCV(SVC(kernel="linear"), ensemble=False)],
+        "clf__estimator__C": [0.1, 1, 10],
+    },
+    {
+        "clf": [CalibratedClassifierCV(LinearSVC(), ensemble=False)],
+        "clf__estimator__C": [0.1, 1, 10],
+    },
+    {"clf": [LogisticRegression(max_iter=1000)], "clf__C": [1, 10, 100]},
+    {
+        "clf": [SGDClassifier(loss="log_loss", random_state=0)],
+        "clf__alpha": [1e-4, 1e-3],
+    },
+]
+
+
+def describe(params):
+    """Return a short description of a candidate's model and vectorizer."""
+    clf = params["clf"]
+    if isinstance(clf, CalibratedClassifierCV):
+        clf = clf.estimator
+    clf_params = [
+        f"{k.rsplit('__', 1)[1]}={v}"
+        for k, v in params.items()
+        if k.startswith("clf__")
+    ]
+    model = f"{type(clf).__name__} ({', '.join(clf_params)})"
+    vect = f"{params['vect__analyzer']} {params['vect__ngram_range']}"
+    return model, vect
+
+
+def measure(pipe, x, n=200):
+    """Return the median latency (ms) of classifying a command, and the model size (kB).
+
+    As in `GameSession.classify`, a command is classified with `predict` and
+    `predict_proba`, one at a time.
+    """
+    samples = x.sample(n, replace=True, random_state=0)
+    times = []
+    for cmd in samples:
+        t = time.perf_counter()
+        pipe.predict([cmd])
+        pipe.predict_proba([cmd])
+        times.append(time.perf_counter() - t)
+    return np.median(times) * 1000, len(pickle.dumps(pipe)) / 1000
+
+
+def search(data_path, model_path, n_splits=5, n_jobs=-1):
+    """Compare vectorizer-classifier pipelines with cross-validation, and save the best.
+
+    Arguments:
+    data_path -- string; path to the csv file with training samples.
+    model_path -- string; path where the best pipeline is saved.
+    n_splits -- integer, default 5. Number of cross-validation folds.
+    n_jobs -- integer, default -1 (all cores). Number of parallel jobs.
+
+    Returns:
+    A scikit-learn Pipeline -- the best pipeline, refitted on all samples.
+    """
+    x, y = get_data(data_path)
+
+    # cache fitted vectorizers, so TF-IDF matrices are reused by all models on a fold
+    cache_dir = tempfile.mkdtemp()
+    try:
+        pipe = Pipeline([("vect", TfidfVectorizer()), ("clf", SVC())], memory=cache_dir)
+        grid = [{**v, **m} for v in VECTORIZERS for m in MODELS]
+        cv = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=0)
+        gs = GridSearchCV(
+            pipe, grid, cv=cv, scoring="accuracy", n_jobs=n_jobs, refit=False
+        )
+        with console.status("Searching models..."):
+            gs.fit(x, y)
+
+        # refit each candidate on all samples, and measure latency and size
+        results = []
+        for params, acc, std in zip(
+            gs.cv_results_["params"],
+            gs.cv_results_["mean_test_score"],
+            gs.cv_results_["std_test_score"],
+        ):
+            params = {k: clone(v) if k == "clf" else v for k, v in params.items()}
+            candidate = clone(pipe).set_params(memory=None, **params)
+            candidate.fit(x, y)
+            latency, size = measure(candidate, x)
+            results.append((acc, std, latency, size, params, candidate))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    # sort by accuracy, then latency
+    results.sort(key=lambda r: (-r[0], r[2]))
+
+    # print results in a table format
+    table = Table(title="Model search")
+    table.add_column("Model")
+    table.add_column("Vectorizer")
+    table.add_column("Accuracy", justify="right")
+    table.add_column("Latency (ms)", justify="right")
+    table.add_column("Size (kB)", justify="right")
+    for acc, std, latency, size, params, _ in results:
+        table.add_row(
+            *describe(params),
+            f"{acc:.3f} ± {std:.3f}",
+            f"{latency:.2f}",
+            f"{size:.0f}",
+        )
+    console.print(table)
+
+    # save the best pipeline
+    best = results[0][-1]
+    dump(best, model_path)
+    console.print("Training complete. Saved the first model in the table.")
+    return best
@@ -32,12 +32,22 @@ class GameSession:
             self.end = end
             self.history = [(start.title, "bright_yellow")]
 
+            # title variables -- redirects seen so far, canonical end point, links
+            self.redirects = {}
+            self.end_title = utils.canonical_title(end.title)
+            self.link_index = None  # built for each new page
+            self.links_resolved = False  # whether the links' redirects are known
+
             # nlp variables -- spacy model, processed text, similarities
             self.nlp = spacy.load(config["spacy"]["model"])
             self.nlp_end = self.nlp(end.title)
             self.nlp_text = self.nlp(start.summary)
             self.sim = []
 
+            # content lines and section index, built the first time `more` is used
+            self.lines = None
+            self.sections = None
+
             # classifier
             self.clf = joblib.load(config["classifier"]["model_path"])
 
@@ -75,8 +85,14 @@ class GameSession:
                 f":tada: You've reached the end point in {len(self.history)-1} moves! :tada:\n"
             )
 
-        # reset similarities and process new summary
+        # index links by normalized title
+        self.link_index = utils.index_links(self.page.links, self.redirects)
+        self.links_resolved = False
+
+        # reset similarities and section index, and process new summary
         self.sim = []
+        self.lines = None
+        self.sections = None
         self.nlp_text = self.nlp(self.page.summary)
 
     def visit(self):
@@ -93,8 +109,20 @@ class GameSession:
         else:
             console.print(f"Detected title: [blue]{title}[/blue]")
 
-        # if title is not found in current page's links, attempt to correct title
-        if title.lower() not in [link.lower() for link in self.page.links]:
+        # if title is found in current page's links (by normalized title or through a
+        # known redirect), use the link's title; otherwise attempt to correct title
+        link = utils.find_link(title, self.link_index, self.redirects)
+        if link is None and not self.links_resolved:
+            # the title may be the target of a link that is a redirect: resolve the
+            # links' redirects (once per page) and look again
+            with console.status("Resolving redirects..."):
+                self.redirects.update(utils.resolve_redirects(self.page.links))
+            self.link_index = utils.index_links(self.page.links, self.redirects)
+            self.links_resolved = True
+            link = utils.find_link(title, self.link_index, self.redirects)
+        if link is not None:
+            title = link
+        else:
             corrected = utils.correct_title(title, self.page.links)
             # if user cancels (`correct_title` returns None), return
             if corrected is None:
@@ -106,21 +134,28 @@ class GameSession:
             else:
                 title = corrected
 
-        # apply appropriate color for the visited page
+        # try to visit new page, and return if unsuccessful
+        page = utils.goto(title, self.nlp, self.nlp_end, self.redirects)
+        if page is None:
+            return
+
+        # apply appropriate color for the visited page (after following redirects)
         if not is_valid or self.history[-1][1] == "red":
             color = "red"
-        elif title.lower() == self.end.title.lower() or self.history[-1][1] == "green":
+        elif self.is_end(page.title) or self.history[-1][1] == "green":
             color = "green"
         else:
             color = "bright_yellow"
 
-        # try to visit new page
-        page = utils.goto(title)
-        # if successful, update history and print panel
-        if page is not None:
-            self.page = page
-            self.history.append((self.page.title, color))
-            self.new_page()
+        # update history and print panel
+        self.page = page
+        self.history.append((self.page.title, color))
+        self.new_page()
+
+    def is_end(self, title):
+        """Check whether a title (or a known redirect to it) is the end point."""
+        title = utils.canonical_title(title)
+        return self.redirects.get(title, title) == self.end_title
 
     def back(self):
         """Go back a certain number of pages, 1 by default."""
@@ -145,21 +180,24 @@ class GameSession:
         )
 
     def more(self):
-        """Print the entire page content via pager."""
-        with console.pager():
-            console.print(self.page.content)
+        """Show the entire page content, one screen at a time, with section navigation."""
+
+        # split content and index sections (unless it has already been done)
+        if self.lines is None:
+            self.lines, self.sections = utils.index_sections(self.page.content)
+
+        utils.view(self.lines, self.page.title, sections=self.sections)
 
     def web(self):
         """Open the current page in the default web browser."""
         webbrowser.open(self.page.url, new=2)
 
     def links(self):
-        """Print a list of links via pager."""
-        with console.pager():
-            console.print("\n".join(self.page.links))
+        """Show the list of links, one screen at a time, with substring filtering."""
+        utils.view(self.page.links, f"Links: {self.page.title}")
 
     def similar(self):
-        """Print a list of links via pager, sorted by semantic similarity to the end point."""
+        """Show the list of links, sorted by semantic similarity to the end point."""
 
         # if the end point's title is out-of-vocabulary, alert user and return
         if self.nlp_end.vector_norm == 0:
@@ -173,11 +211,11 @@ class GameSession:
             for link in track(self.page.links, description="Computing similarities..."):
                 self.sim.append(self.nlp_end.similarity(self.nlp(link)))
 
-        # print links and scores
-        tmp = zip(self.sim, self.page.links)
-        tmp = [f"{link} : {sim}" for sim, link in reversed(sorted(tmp))]
-        with console.pager():
-            console.print("\n".join(tmp))
+        # show links and scores, formatting only the lines that are displayed
+        tmp = sorted(zip(self.sim, self.page.links), reverse=True)
+        utils.view(
+            tmp, f"Similar: {self.page.title}", fmt=lambda x: f"{x[1]} : {x[0]}"
+        )
 
     def entities(self):
         """Highlight named entities in the current page summary."""
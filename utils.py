@@ -1,13 +1,19 @@
+import math
 import re
 import string
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import wikipedia
 from jellyfish import jaro_winkler_similarity
+from requests.exceptions import RequestException
 from rich import print
-from rich.columns import Columns
+from rich.cells import cell_len
 from rich.console import Console
 from rich.prompt import IntPrompt, Prompt
+from rich.rule import Rule
+from rich.table import Table
 
 console = Console()
 
@@ -146,16 +152,117 @@ def spellcheck(title, links):
     return links[np.argmax(distances)]
 
 
-def goto(title):
-    """Given a title, visit the corresponding page with error handling."""
+def canonical_title(title):
+    """Return a title as MediaWiki compares it (only the first letter is case-free)."""
+    title = unicodedata.normalize("NFKC", title).replace("_", " ")
+    title = " ".join(title.split())
+    return title[:1].upper() + title[1:]
+
+
+def normalize_title(title):
+    """Normalize a title for loose comparisons, ignoring case entirely."""
+    return canonical_title(title).casefold()
+
+
+def resolve_redirects(titles, max_workers=8, batch_size=50):
+    """Find redirects among titles, with concurrent requests of `batch_size` titles.
+
+    Arguments:
+    titles -- list of strings; titles to resolve (e.g. links in the current page).
+
+    Returns:
+    A dictionary -- canonical titles of redirects to canonical titles of their target
+    pages. Batches whose request fails are left out.
+    """
+
+    def resolve(batch):
+        try:
+            query = wikipedia.wikipedia._wiki_request(
+                {"redirects": "", "titles": "|".join(batch)}
+            )["query"]
+        except (wikipedia.exceptions.WikipediaException, RequestException, KeyError):
+            return {}
+        return {
+            canonical_title(r["from"]): canonical_title(r["to"])
+            for r in query.get("redirects", [])
+        }
+
+    batches = [titles[i : i + batch_size] for i in range(0, len(titles), batch_size)]
+    redirects = {}
+    n_workers = max(1, min(max_workers, len(batches)))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        for resolved in executor.map(resolve, batches):
+            redirects.update(resolved)
+    return redirects
+
+
+def index_links(links, redirects):
+    """Map normalized titles, and the titles that known redirects lead to, to links.
+
+    Arguments:
+    links -- list of strings; links in the current page.
+    redirects -- dictionary; canonical requested titles to canonical page titles.
+
+    Returns:
+    A dictionary -- normalized titles to lists of the corresponding links.
+    """
+    index = {}
+    for link in links:
+        target = canonical_title(link)
+        target = redirects.get(target, target)
+        for key in {normalize_title(link), normalize_title(target)}:
+            if link not in index.setdefault(key, []):
+                index[key].append(link)
+    return index
+
+
+def find_link(title, index, redirects):
+    """Return the link matching a title, or None if there is none or it is ambiguous.
+
+    A link with the same canonical title is preferred; otherwise, a title matches if a
+    single link has the same normalized title, or leads to the same page through a
+    redirect.
+    """
+    candidates = index.get(normalize_title(title), [])
+    if title in candidates:
+        return title
+    for link in candidates:
+        if canonical_title(link) == canonical_title(title):
+            return link
+    if len(candidates) == 1:
+        return candidates[0]
+
+    # otherwise, the title itself may be a redirect to a linked page
+    target = canonical_title(title)
+    candidates = index.get(normalize_title(redirects.get(target, target)), [])
+    if len(candidates) == 1:
+        return candidates[0]
+
+
+def goto(title, nlp=None, nlp_end=None, redirects=None):
+    """Given a title, visit the corresponding page with error handling.
+
+    Arguments:
+    title -- string; title of the page to visit.
+    nlp -- spaCy model object, default None. Used to rank disambiguation options.
+    nlp_end -- spaCy Doc of the end point's title, default None.
+    redirects -- dictionary, default None. If given, a redirect followed to reach the
+    page is recorded in it (canonical titles).
+
+    Returns:
+    A wikipedia `Page` object or None -- the visited page (None if cancelled).
+    """
 
     # try to visit page
     try:
         page = wikipedia.page(title, auto_suggest=False)
+        key = canonical_title(title)
+        if redirects is not None and key != canonical_title(page.title):
+            redirects[key] = canonical_title(page.title)
 
     # in case of disambiguation, prompt user to select an option or cancel
     except wikipedia.exceptions.DisambiguationError as e:
-        page = disambiguate(e)
+        page = disambiguate(e, nlp, nlp_end)
 
     # in case of page error, alert user and return None
     except wikipedia.exceptions.PageError:
@@ -165,8 +272,60 @@ def goto(title):
     return page
 
 
-def disambiguate(e):
-    """Given a DisambiguationError, print the list of options and prompt for a selection."""
+def fetch_summaries(titles):
+    """Get the summaries of up to 20 pages with a single request.
+
+    Arguments:
+    titles -- list of strings; titles of the pages.
+
+    Returns:
+    A dictionary -- requested titles to (page title, summary) tuples, following
+    redirects. Pages reported as missing or disambiguation pages are left out. If the
+    request fails, or a page is not in the response, its summary is None.
+    """
+    try:
+        query = wikipedia.wikipedia._wiki_request(
+            {
+                "prop": "extracts|pageprops",
+                "explaintext": "",
+                "exintro": "",
+                "exlimit": "max",
+                "ppprop": "disambiguation",
+                "redirects": "",
+                "titles": "|".join(titles),
+            }
+        )["query"]
+    except (wikipedia.exceptions.WikipediaException, RequestException, KeyError):
+        return {title: (title, None) for title in titles}
+
+    # follow title normalizations, then redirects, to the titles of the pages
+    resolved = {title: title for title in titles}
+    for step in ["normalized", "redirects"]:
+        hops = {r["from"]: r["to"] for r in query.get(step, [])}
+        resolved = {t: hops.get(r, r) for t, r in resolved.items()}
+
+    # drop missing and disambiguation pages
+    pages, dropped = {}, set()
+    for p in query.get("pages", {}).values():
+        if (
+            "missing" in p
+            or "invalid" in p
+            or "disambiguation" in p.get("pageprops", {})
+        ):
+            dropped.add(p.get("title"))
+        else:
+            pages[p["title"]] = p.get("extract", "")
+    return {t: (r, pages.get(r)) for t, r in resolved.items() if r not in dropped}
+
+
+def disambiguate(e, nlp=None, nlp_end=None, max_workers=8, batch_size=20):
+    """Given a DisambiguationError, print the list of options and prompt for a selection.
+
+    The options' summaries are fetched in batches of `batch_size` titles, sent
+    concurrently, then shown with each option and, if `nlp` and `nlp_end` are given,
+    sorted by semantic similarity to the end point. Options whose summary could not be
+    fetched are shown last, without a snippet.
+    """
 
     # get options
     options = [
@@ -175,10 +334,44 @@ def disambiguate(e):
         if not opt.startswith("All pages") and not opt.endswith("(disambiguation)")
     ]
 
-    # assign numbers to options
-    options_ = [f"({i + 1}) {opt}" for i, opt in enumerate(options)]
-    # print options in column format
-    print(Columns(options_, equal=True, expand=True))
+    # fetch all summaries in parallel, and drop options that do not exist
+    with console.status("Loading options..."):
+        batches = [
+            options[i : i + batch_size] for i in range(0, len(options), batch_size)
+        ]
+        n_workers = max(1, min(max_workers, len(batches)))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            fetched = {}
+            for summaries in executor.map(fetch_summaries, batches):
+                fetched.update(summaries)
+
+        # keep options in order, once per page (several options may redirect to one)
+        pages = {}
+        for opt in options:
+            if opt in fetched:
+                title, summary = fetched[opt]
+                if pages.get(title) is None:
+                    pages[title] = summary
+        pages = list(pages.items())
+        unknown = [p for p in pages if p[1] is None]
+        pages = [p for p in pages if p[1] is not None]
+
+        # sort by similarity to the end point, unless its title is out-of-vocabulary;
+        # only word vectors are needed, so texts are tokenized but not fully processed
+        if nlp is not None and nlp_end is not None and nlp_end.vector_norm != 0:
+            docs = nlp.tokenizer.pipe(f"{title}. {summary}" for title, summary in pages)
+            sim = [nlp_end.similarity(doc) for doc in docs]
+            pages = [p for _, p in sorted(zip(sim, pages), key=lambda x: -x[0])]
+        pages += unknown
+
+    # print numbered options, with the start of their summaries
+    table = Table(show_header=False, box=None, expand=True)
+    table.add_column(style="cyan", no_wrap=True)
+    table.add_column(style="blue", no_wrap=True)
+    table.add_column(ratio=1, no_wrap=True, overflow="ellipsis")
+    for i, (title, summary) in enumerate(pages):
+        table.add_row(f"({i + 1})", title, " ".join((summary or "").split()))
+    console.print(table)
 
     # prompt user for a selection
     print("You've reached a [cyan]disambiguation page[/cyan]!")
@@ -187,11 +380,115 @@ def disambiguate(e):
         default=0,
     )
 
-    # return None if canceled or invalid selection, otherwise return selected page
-    if tmp < 1 or tmp > len(options) + 1:
+    # return None if canceled or invalid selection
+    if tmp < 1 or tmp > len(pages):
         return None
-    else:
-        return wikipedia.page(options[tmp - 1], auto_suggest=False)
+
+    # otherwise, load the selected page, reusing its summary
+    title, summary = pages[tmp - 1]
+    try:
+        page = wikipedia.page(title, auto_suggest=False)
+    except (wikipedia.exceptions.WikipediaException, RequestException, KeyError):
+        console.print("[red]The page you're trying to visit could not be loaded.[/red]")
+        return None
+    if summary is not None:
+        page._summary = summary
+    return page
+
+
+def index_sections(content):
+    """Split page content into lines and index its section headings.
+
+    Arguments:
+    content -- string; the plain-text content of a page.
+
+    Returns:
+    A list of strings -- the lines of the content (headings included).
+    A list of (title, level, line number) tuples -- one for each section.
+    """
+    heading = re.compile(r"^(={2,})\s*(.+?)\s*\1$")
+    lines = content.splitlines()
+    sections = [("Summary", 1, 0)]
+    for i, line in enumerate(lines):
+        match = heading.match(line.strip())
+        if match is not None:
+            sections.append((match.group(2), len(match.group(1)) - 1, i))
+    return lines, sections
+
+
+def view(lines, title, fmt=str, sections=None):
+    """Show a list of lines one screen at a time, rendering only the visible chunk.
+
+    Arguments:
+    lines -- list; the items to show.
+    title -- string; title printed above each chunk.
+    fmt -- function, default str. Converts an item to the string to print.
+    sections -- list of (title, level, line number) tuples, default None.
+
+    The user can press enter to go to the next chunk, and enter `p` to go to the
+    previous one, `s` to list sections, `s <name>` to jump to a section, `/<text>` to
+    filter items by substring (`/` alone clears the filter), or `q` to quit.
+    """
+    shown = range(len(lines))  # indices of the items matching the filter
+    offset = 0
+    previous = []  # offsets of previously shown chunks, for `p`
+    options = "enter: next, p: previous, /text: filter, q: quit"
+    if sections is not None:
+        options = options.replace("q: quit", "s name: section, q: quit")
+
+    redraw = True
+    while True:
+        # fill the screen, estimating how many rows each (wrapped) line takes up from
+        # its width in terminal cells
+        if redraw:
+            rows = max(console.height - 4, 5)
+            console.print(Rule(title, style="blue"))
+            end = offset
+            while end < len(shown) and rows > 0:
+                text = fmt(lines[shown[end]]).expandtabs(console.tab_size)
+                console.print(text, markup=False, highlight=False)
+                rows -= max(1, math.ceil(cell_len(text) / console.width))
+                end += 1
+        redraw = True
+
+        # show position and prompt for an action
+        cmd = Prompt.ask(
+            f"[blue]{end}/{len(shown)}[/blue] ({options})",
+            default="",
+            show_default=False,
+        ).strip()
+
+        if cmd == "q":
+            return
+        elif cmd == "":
+            if end >= len(shown):
+                return
+            previous.append(offset)
+            offset = end
+        elif cmd == "p":
+            offset = previous.pop() if previous else 0
+        elif cmd.startswith("/"):
+            term = cmd[1:].lower()
+            shown = [i for i in range(len(lines)) if term in fmt(lines[i]).lower()]
+            offset, previous = 0, []
+        elif sections is not None and (cmd == "s" or cmd.startswith("s ")):
+            # look for a section with that exact name, otherwise containing it
+            name = cmd[2:].strip().lower()
+            matches = [s for s in sections if s[0].lower() == name]
+            if not matches:
+                matches = [s for s in sections if name in s[0].lower()]
+
+            # jump to the section if there's a single match (clearing the filter)
+            if name != "" and len(matches) == 1:
+                shown = range(len(lines))
+                offset, previous = matches[0][2], []
+            # otherwise, list the matching sections (or all of them)
+            else:
+                for s_title, level, _ in matches or sections:
+                    console.print("  " * (level - 1) + s_title, markup=False)
+                redraw = False
+        else:
+            redraw = False
 
 
 def detect_back_n(cmd, len_h):
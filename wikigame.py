@@ -10,7 +10,7 @@ from click import edit
 from rich.prompt import IntPrompt, Prompt
 from rich.traceback import install
 
-from classification import LinearSVC
+from classification import LinearSVC, search
 from session import GameSession
 from utils import console
 
@@ -54,8 +54,9 @@ def start_menu():
         "([green]1[/green]) New game with random pages",
         "([green]2[/green]) New game with defined pages",
         "([bright_yellow]3[/bright_yellow]) Train classifier",
-        "([bright_yellow]4[/bright_yellow]) Settings",
-        "([red]5[/red]) Exit",
+        "([bright_yellow]4[/bright_yellow]) Train classifier with model search",
+        "([bright_yellow]5[/bright_yellow]) Settings",
+        "([red]6[/red]) Exit",
     ]
 
     console.print(
@@ -70,11 +71,15 @@ def start_menu():
     tmp = 100
     while tmp > 2:
         tmp = IntPrompt.ask("Select from the options above")
-        if tmp == 5:
+        if tmp == 6:
             exit()
-        elif tmp == 4:
+        elif tmp == 5:
             edit(filename="./config.ini")
             config.read("./config.ini")
+        elif tmp == 4:
+            search.search(
+                config["classifier"]["data_path"], config["classifier"]["model_path"]
+            )
         elif tmp == 3:
             LinearSVC.train(
                 config["classifier"]["data_path"], config["classifier"]["model_path"]